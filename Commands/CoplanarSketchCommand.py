@@ -1,38 +1,3 @@
-from pathlib import Path
-import sys
+from Commands._macro_command import make_macro_command
 
-import FreeCAD
-import FreeCADGui
-
-class CoplanarSketchCommand:
-    base_path: Path = Path(__file__).parent.parent / "Macros/CoplanarSketch"
-
-    def GetResources(self):
-        icon_path = self.base_path / "CoplanarSketch.svg"
-        return {
-            'Pixmap': str(icon_path),
-            'MenuText': 'Coplanar Sketch',
-            'ToolTip': 'Create sketches coplanar to selected faces'
-        }
-
-    def Activated(self):
-        if str(self.base_path) not in sys.path:
-            sys.path.append(str(self.base_path))
-
-        try:
-            import importlib
-            if 'CoplanarSketch' in sys.modules:
-                import CoplanarSketch
-                importlib.reload(CoplanarSketch)
-            else:
-                import CoplanarSketch
-
-            # The show_edge_data_collector_docker() runs on import/reload
-
-        except Exception as e:
-            FreeCAD.Console.PrintError(f"Error running CoplanarSketch: {e}\n")
-            import traceback
-            traceback.print_exc()
-
-    def IsActive(self):
-        return True
+CoplanarSketchCommand = make_macro_command("CoplanarSketch", "show_edge_data_collector_docker")
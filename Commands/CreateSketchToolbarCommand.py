@@ -1,94 +1,38 @@
-import sys
 from pathlib import Path
+import traceback
 
 import FreeCAD
-import FreeCADGui
-from PySide import QtGui, QtCore
+
+from Commands import MACROS, _toolbar_builder
+from Commands._resources import RESOURCES
+from Commands._utils import get_icon, run_macro
 
 class CreateSketchToolbarCommand:
-    wb_path: Path = Path(__file__).parent.parent
+    _RESOURCES = RESOURCES["CreateSketchToolbarCommand"]
 
     def GetResources(self):
-        return {
-            'Pixmap': '',  # No icon
-            'MenuText': 'Create Sketch Toolbar',
-            'ToolTip': 'Create a toolbar with sketch tools that appears only in Sketcher workbench'
-        }
+        return self._RESOURCES
 
     def Activated(self):
         try:
-            mw = FreeCADGui.getMainWindow()
-            toolbar_name = "Detessellate_Sketch_Tools"
-
-            # Check if toolbar already exists
-            existing_toolbar = None
-            for toolbar in mw.findChildren(QtGui.QToolBar):
-                if toolbar.objectName() == toolbar_name:
-                    existing_toolbar = toolbar
-                    break
-
-            if existing_toolbar:
-                FreeCAD.Console.PrintMessage("Detessellate Sketch Tools toolbar already exists.\n")
-                return
-
-            # Create new toolbar
-            custom_toolbar = QtGui.QToolBar("Detessellate Sketch Tools", mw)
-            custom_toolbar.setObjectName(toolbar_name)
-            mw.addToolBar(QtCore.Qt.TopToolBarArea, custom_toolbar)
-
-            # Add buttons
-            self.add_sketch_reprofile_button(custom_toolbar)
-            self.add_sketcher_wiredoctor_button(custom_toolbar)
-
-            # Connect to workbench changes to show/hide toolbar
-            self.connect_workbench_toggle(custom_toolbar)
-
-            # Set initial visibility based on current workbench
-            current_wb = FreeCADGui.activeWorkbench()
-            is_sketcher = current_wb and current_wb.name() == "SketcherWorkbench"
-            custom_toolbar.setVisible(is_sketcher)
-
-            #FreeCAD.Console.PrintMessage("✓ Created 'Detessellate Sketch Tools' toolbar.\n")
-            #FreeCAD.Console.PrintMessage("This toolbar appears only in Sketcher workbench.\n")
-            #FreeCAD.Console.PrintMessage("Note: Run this command again after restarting FreeCAD if needed.\n")
+            _toolbar_builder.build(
+                "Detessellate_Sketch_Tools", "Detessellate Sketch Tools",
+                buttons=[self.add_sketch_reprofile_button, self.add_sketcher_wiredoctor_button],
+                workbench="SketcherWorkbench",
+            )
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error creating sketch toolbar: {e}\n")
-            import traceback
             traceback.print_exc()
 
-    def connect_workbench_toggle(self, toolbar):
-        """Connect to workbench activation to show/hide toolbar"""
-        try:
-            mw = FreeCADGui.getMainWindow()
-
-            # Store reference to toolbar in the main window so the lambda can access it
-            if not hasattr(mw, '_detessellate_sketch_toolbars'):
-                mw._detessellate_sketch_toolbars = []
-            mw._detessellate_sketch_toolbars.append(toolbar)
-
-            # Create a callback that shows/hides the toolbar
-            def on_workbench_changed():
-                try:
-                    current_wb = FreeCADGui.activeWorkbench()
-                    # More robust check - use class name instead of name() method
-                    is_sketcher = current_wb and current_wb.__class__.__name__ == "SketcherWorkbench"
-                    toolbar.setVisible(is_sketcher)
-                except Exception as e:
-                    FreeCAD.Console.PrintWarning(f"Error in workbench toggle: {e}\n")
-
-            # Connect to workbench activated signal
-            mw.workbenchActivated.connect(on_workbench_changed)
-
-        except Exception as e:
-            FreeCAD.Console.PrintWarning(f"Could not connect workbench toggle: {e}\n")
-
     def add_sketch_reprofile_button(self, toolbar):
         """Add SketchReProfile button that directly calls the macro"""
+        from PySide import QtGui
+
         try:
-            macro_path = self.wb_path / "Macros" / "SketchReProfile"
+            macro_path = MACROS / "SketchReProfile"
             icon_path = macro_path / "SketchReProfile.svg"
-            icon = QtGui.QIcon(str(icon_path))
+            icon = get_icon(str(icon_path))
 
             action = QtGui.QAction(icon, "Sketch ReProfile", toolbar)
             action.setToolTip(
@@ -105,10 +49,12 @@ class CreateSketchToolbarCommand:
 
     def add_sketcher_wiredoctor_button(self, toolbar):
         """Add SketcherWireDoctor button that directly calls the macro"""
+        from PySide import QtGui
+
         try:
-            macro_path = self.wb_path / "Macros" / "SketcherWireDoctor"
+            macro_path = MACROS / "SketcherWireDoctor"
             icon_path = macro_path / "SketcherWireDoctor.svg"
-            icon = QtGui.QIcon(str(icon_path))
+            icon = get_icon(str(icon_path))
 
             action = QtGui.QAction(icon, "Sketcher Wire Doctor", toolbar)
             action.setToolTip(
@@ -126,42 +72,20 @@ class CreateSketchToolbarCommand:
     def run_sketch_reprofile(self, macro_path: Path) -> None:
         """Directly run the SketchReProfile macro"""
         try:
-            if str(macro_path) not in sys.path:
-                sys.path.append(str(macro_path))
-
-            import importlib
-            if 'SketchReProfile' in sys.modules:
-                import SketchReProfile
-                importlib.reload(SketchReProfile)
-            else:
-                import SketchReProfile
-
-            SketchReProfile.final_sketcher_main()
+            run_macro(macro_path, "SketchReProfile", "final_sketcher_main")
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error running SketchReProfile: {e}\n")
-            import traceback
             traceback.print_exc()
 
     def run_sketcher_wiredoctor(self, macro_path: Path) -> None:
         """Directly run the SketcherWireDoctor macro"""
         try:
-            if str(macro_path) not in sys.path:
-                sys.path.append(str(macro_path))
-
-            import importlib
-            if 'SketcherWireDoctor_Main' in sys.modules:
-                import SketcherWireDoctor_Main
-                importlib.reload(SketcherWireDoctor_Main)
-            else:
-                import SketcherWireDoctor_Main
-
             # Call the main function to show the docker
-            SketcherWireDoctor_Main.show_sketcher_wire_doctor()
+            run_macro(macro_path, "SketcherWireDoctor_Main", "show_sketcher_wire_doctor")
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error running SketcherWireDoctor: {e}\n")
-            import traceback
             traceback.print_exc()
 
     def IsActive(self):
@@ -1,48 +1,54 @@
-from pathlib import Path
-import sys
-
 import FreeCAD
-import FreeCADGui
-
-class EdgeLoopToSketchCommand:
-    base_path: Path = Path(__file__).parent.parent / "Macros/EdgeLoopToSketch"
-
-    def GetResources(self):
-        icon_path = self.base_path / "EdgeLoopToSketch.svg"
-        return {
-            'Pixmap': str(icon_path),
-            'MenuText': 'Edge Loop to Sketch',
-            'ToolTip': 'Convert selected edge loops to parametric sketch'
-        }
-
-    def Activated(self):
-        if str(self.base_path) not in sys.path:
-            sys.path.append(str(self.base_path))
-
-        try:
-            import importlib
-            if 'EdgeLoopToSketch' in sys.modules:
-                import EdgeLoopToSketch
-                importlib.reload(EdgeLoopToSketch)
-            else:
-                import EdgeLoopToSketch
-
-            # The macro executes on import via edge_loop_to_sketch() call at end
-
-        except Exception as e:
-            FreeCAD.Console.PrintError(f"Error running EdgeLoopToSketch: {e}\n")
-            import traceback
-            traceback.print_exc()
-
-    def IsActive(self):
-        # Only active when edges are selected
-        selection = FreeCADGui.Selection.getSelectionEx()
-        if not selection:
-            return False
-        
-        # Check if any edges are selected
-        for sel in selection:
-            if any(name.startswith("Edge") for name in sel.SubElementNames):
-                return True
-        
-        return False
\ No newline at end of file
+
+from Commands._macro_command import make_macro_command
+
+class _SelectionTracker:
+    """Selection observer that counts selection changes"""
+
+    def __init__(self):
+        self.generation = 0
+        self._installed = False
+
+    def watch(self):
+        """Install the observer on first use and return the change count"""
+        if not self._installed:
+            import FreeCADGui
+
+            FreeCADGui.Selection.addObserver(self)
+            self._installed = True
+            self.generation += 1
+        return self.generation
+
+    def _changed(self, *args):
+        self.generation += 1
+
+    addSelection = removeSelection = setSelection = clearSelection = _changed
+
+_selection_tracker = _SelectionTracker()
+
+# (document name, selection generation) of the last IsActive() scan and its result
+_last_scan = [None, False]
+
+def _is_active(self):
+    import FreeCADGui
+
+    # Rescan only after the selection or the active document changed
+    doc = FreeCAD.ActiveDocument
+    key = (doc.Name if doc else None, _selection_tracker.watch())
+    if key == _last_scan[0]:
+        return _last_scan[1]
+
+    # Only active when edges are selected
+    selection = FreeCADGui.Selection.getSelectionEx()
+    result = any(
+        name.startswith("Edge")
+        for sel in selection
+        for name in sel.SubElementNames
+    )
+    _last_scan[0], _last_scan[1] = key, result
+    return result
+
+EdgeLoopToSketchCommand = make_macro_command(
+    "EdgeLoopToSketch", "edge_loop_to_sketch",
+    is_active=_is_active,
+)
@@ -1,39 +1,3 @@
-from pathlib import Path
-import sys
+from Commands._macro_command import make_macro_command
 
-import FreeCAD
-import FreeCADGui
-
-class TopoMatchSelectorCommand:
-    base_path: Path = Path(__file__).parent.parent / "Macros/TopoMatchSelector"
-
-    def GetResources(self):
-        icon_path = self.base_path / "TopoMatchSelector.svg"
-        return {
-            'Pixmap': str(icon_path),
-            'MenuText': 'Topo Match Selector',
-            'ToolTip': 'Select topology matching elements'
-        }
-
-    def Activated(self):
-        if str(self.base_path) not in sys.path:
-            sys.path.append(str(self.base_path))
-
-        try:
-            import importlib
-            if 'TopoMatchSelector' in sys.modules:
-                import TopoMatchSelector
-                importlib.reload(TopoMatchSelector)
-            else:
-                import TopoMatchSelector
-
-            # Call the function that creates the docker
-            TopoMatchSelector.create_topo_match_selector()
-
-        except Exception as e:
-            FreeCAD.Console.PrintError(f"Error running TopoMatchSelector: {e}\n")
-            import traceback
-            traceback.print_exc()
-
-    def IsActive(self):
-        return True  # Adjust if it needs specific conditions
+TopoMatchSelectorCommand = make_macro_command("TopoMatchSelector", "create_topo_match_selector")
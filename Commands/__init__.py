@@ -0,0 +1,10 @@
+"""Detessellate workbench commands."""
+
+from pathlib import Path
+
+# Command name -> QAction, filled lazily by Commands._utils.get_action()
+from Commands._utils import _action_registry
+
+# Workbench root and the bundled macro directories
+WB_ROOT: Path = Path(__file__).resolve().parent.parent
+MACROS: Path = WB_ROOT / "Macros"
@@ -0,0 +1,45 @@
+"""Import-free stand-in registered with FreeCADGui for each command."""
+
+import importlib
+import traceback
+
+import FreeCAD
+
+from Commands._resources import RESOURCES
+
+class LazyCommand:
+    """Command proxy that imports the real command class on first use
+
+    GetResources() is served from the static Commands._resources table, so
+    registering a command does not import its module.
+    """
+
+    def __init__(self, module_path, class_name):
+        self._module_path = module_path
+        self._class_name = class_name
+        self._real = None
+        self._failed = False
+
+    def _resolve(self):
+        if self._real is None and not self._failed:
+            try:
+                module = importlib.import_module(self._module_path)
+                self._real = getattr(module, self._class_name)()
+            except Exception as e:
+                # Report once, as a single write; IsActive() is polled continuously
+                self._failed = True
+                FreeCAD.Console.PrintError(
+                    f"ERROR importing {self._class_name}: {e}\n{traceback.format_exc()}")
+        return self._real
+
+    def GetResources(self):
+        return RESOURCES[self._class_name]
+
+    def Activated(self):
+        real = self._resolve()
+        if real is not None:
+            real.Activated()
+
+    def IsActive(self):
+        real = self._resolve()
+        return real is not None and real.IsActive()
@@ -0,0 +1,47 @@
+"""Factory for the commands that just run one of the bundled macros."""
+
+import traceback
+
+import FreeCAD
+
+from Commands import MACROS
+from Commands._resources import RESOURCES
+from Commands._utils import get_or_load
+
+def make_macro_command(name, entry=None, *, macro_dir=None, module=None,
+                       entry_kwargs=None, is_active=None):
+    """Return the FreeCAD command class <name>Command running macro `name`
+
+    The macro module `module` (default `name`) is loaded from
+    Macros/<macro_dir> (default `name`) and its `entry` function, if any, is
+    called with `entry_kwargs`. Menu text, tooltip and icon come from
+    Commands._resources. `is_active` replaces the always-active IsActive().
+    """
+    base_path = MACROS / (macro_dir or name)
+    module_name = module or name
+    kwargs = entry_kwargs or {}
+
+    class MacroCommand:
+        _RESOURCES = RESOURCES[f"{name}Command"]
+
+        def GetResources(self):
+            return self._RESOURCES
+
+        def Activated(self):
+            try:
+                macro = get_or_load(module_name, self.base_path)
+                if macro is not None and entry is not None:
+                    getattr(macro, entry)(**kwargs)
+
+            except Exception as e:
+                FreeCAD.Console.PrintError(f"Error running {name}: {e}\n")
+                traceback.print_exc()
+
+        def IsActive(self):
+            return True
+
+    if is_active is not None:
+        MacroCommand.IsActive = is_active
+    MacroCommand.base_path = base_path
+    MacroCommand.__name__ = MacroCommand.__qualname__ = f"{name}Command"
+    return MacroCommand
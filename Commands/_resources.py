@@ -0,0 +1,57 @@
+"""Static GetResources() data for every Detessellate command.
+
+Kept free of FreeCAD/Qt imports so InitGui can register its command proxies
+without importing the command modules themselves.
+"""
+
+from Commands import MACROS
+
+def _macro(name, menu_text, tooltip, macro_dir=None):
+    return {
+        'Pixmap': str(MACROS / (macro_dir or name) / f"{name}.svg"),
+        'MenuText': menu_text,
+        'ToolTip': tooltip
+    }
+
+def _toolbar(menu_text, tooltip):
+    return {
+        'Pixmap': '',  # No icon
+        'MenuText': menu_text,
+        'ToolTip': tooltip
+    }
+
+# Command class name -> GetResources() dict
+RESOURCES = {
+    "CoplanarSketchCommand": _macro(
+        "CoplanarSketch", 'Coplanar Sketch', 'Create sketches coplanar to selected faces'),
+    "EdgeLoopSelectorCommand": _macro(
+        "EdgeLoopSelector", 'Edge Loop Selector', 'Select connected edge loops'),
+    "EdgeLoopToSketchCommand": _macro(
+        "EdgeLoopToSketch", 'Edge Loop to Sketch', 'Convert selected edge loops to parametric sketch'),
+    "MeshPlacementCommand": _macro(
+        "MeshPlacement", 'Mesh Placement', 'Center and align meshes at origin'),
+    "MeshToBodyCommand": _macro(
+        "MeshToBody", 'Mesh To Body', 'Convert mesh to parametric body'),
+    "PointPlaneSketchCommand": _macro(
+        "PointPlaneSketch", 'Point Plane Sketch', 'Create sketch from point and plane'),
+    "ReconstructSolidCommand": _macro(
+        "ReconstructSolid", 'Reconstruct Solid', 'Reconstruct solid from mesh or sketches'),
+    "SketchReProfileCommand": _macro(
+        "SketchReProfile", 'Sketch ReProfile',
+        'Reprocess sketch profiles - converts construction lines to circles, arcs, and splines'),
+    "SketcherWireDoctorCommand": _macro(
+        "SketcherWireDoctor", 'Sketcher Wire Doctor', 'Fix sketch wire issues'),
+    "TopoMatchSelectorCommand": _macro(
+        "TopoMatchSelector", 'Topo Match Selector', 'Select topology matching elements'),
+    "VarSetUpdateCommand": _macro(
+        "VarSetUpdate", 'VarSet Update', 'Update VarSet Properties', macro_dir="VarSet-Update"),
+    "CreateSketchToolbarCommand": _toolbar(
+        'Create Sketch Toolbar',
+        'Create a toolbar with sketch tools that appears only in Sketcher workbench'),
+    "CreatePartDesignToolbarCommand": _toolbar(
+        'Create PartDesign Toolbar',
+        'Create a toolbar with PartDesign-specific tools that appears only in PartDesign workbench'),
+    "CreateGlobalToolbarCommand": _toolbar(
+        'Create Global Toolbar',
+        'Create a toolbar with universal tools that appears in all workbenches'),
+}
@@ -0,0 +1,61 @@
+"""Data-driven construction of the Detessellate custom toolbars."""
+
+import traceback
+
+import FreeCAD
+
+from Commands._utils import get_action, register_workbench_toolbar
+
+def add_command_button(mw, toolbar, command_name):
+    """Add a button using the registered FreeCAD command"""
+    try:
+        # Find the action created by FreeCAD when command was registered
+        action = get_action(mw, command_name)
+        if action is not None:
+            toolbar.addAction(action)
+            return
+
+        FreeCAD.Console.PrintWarning(f"Could not find {command_name} action\n")
+
+    except Exception as e:
+        FreeCAD.Console.PrintError(f"Error adding {command_name} button: {e}\n")
+        traceback.print_exc()
+
+def build(name, title, area=None, commands=(), workbench=None, buttons=()):
+    """Create toolbar `name` unless it already exists
+
+    `commands` are registered command names whose actions are reused,
+    `buttons` are callables that add custom actions to the new toolbar, and
+    `workbench` is the workbench class name the toolbar is limited to (None
+    keeps it visible everywhere). Returns the toolbar, or None if it existed.
+    """
+    import FreeCADGui
+    from PySide import QtGui, QtCore
+
+    mw = FreeCADGui.getMainWindow()
+
+    # Check if toolbar already exists
+    if mw.findChild(QtGui.QToolBar, name) is not None:
+        FreeCAD.Console.PrintMessage(f"{name.replace('_', ' ')} toolbar already exists.\n")
+        return None
+
+    # Create new toolbar
+    toolbar = QtGui.QToolBar(title, mw)
+    toolbar.setObjectName(name)
+    mw.addToolBar(QtCore.Qt.TopToolBarArea if area is None else area, toolbar)
+
+    # Registered commands give proper tooltips automatically
+    for command_name in commands:
+        add_command_button(mw, toolbar, command_name)
+    for add_button in buttons:
+        add_button(toolbar)
+
+    if workbench is None:
+        toolbar.setVisible(True)
+    else:
+        # Show/hide on workbench changes, starting from the current workbench
+        register_workbench_toolbar(mw, toolbar, workbench)
+        current_wb = FreeCADGui.activeWorkbench()
+        toolbar.setVisible(bool(current_wb) and type(current_wb).__name__ == workbench)
+
+    return toolbar
@@ -0,0 +1,157 @@
+"""Shared helpers for the Detessellate commands."""
+
+import functools
+import importlib
+import importlib.util
+import os
+import sys
+
+# Set DETESSELLATE_DEV_RELOAD=1 to pick up macro edits without restarting FreeCAD
+DEV_RELOAD = os.environ.get("DETESSELLATE_DEV_RELOAD") == "1"
+
+# Macro directories this package has appended to sys.path
+_injected_paths: set = set()
+
+# Module name -> macro module loaded by get_or_load(); only macros live here
+_macro_modules: dict = {}
+
+# Command name -> QAction created by FreeCAD for that command
+_action_registry: dict = {}
+
+def _is_alive(action, name):
+    try:
+        return action.objectName() == name
+    except RuntimeError:
+        # The C++ QAction was deleted behind the wrapper's back
+        return False
+
+def get_action(mw, name):
+    """Return the QAction FreeCAD created for command `name`, or None"""
+    action = _action_registry.get(name)
+    if action is not None and _is_alive(action, name):
+        return action
+
+    from PySide import QtGui
+
+    # Rebuild the registry on a miss; actions are created lazily by FreeCAD
+    _action_registry.clear()
+    for candidate in mw.findChildren(QtGui.QAction):
+        action_name = candidate.objectName()
+        if action_name:
+            _action_registry[action_name] = candidate
+    return _action_registry.get(name)
+
+@functools.lru_cache(maxsize=64)
+def get_icon(path_str):
+    """Return a shared QIcon for an icon file path ('' gives an empty icon)"""
+    from PySide import QtGui
+
+    return QtGui.QIcon(path_str) if path_str else QtGui.QIcon()
+
+def add_macro_path(macro_path):
+    """Append a macro directory to sys.path once per session"""
+    p = str(macro_path)
+    if p not in _injected_paths:
+        sys.path.append(p)
+        _injected_paths.add(p)
+
+def _has_sibling_modules(macro_path, module_name):
+    return any(
+        entry.endswith(".py") and entry != f"{module_name}.py"
+        for entry in os.listdir(str(macro_path))
+    )
+
+def _macro_file(module_name, macro_path):
+    return os.path.join(str(macro_path), f"{module_name}.py")
+
+def _loaded_from(module, macro_file):
+    """Return True if `module` was imported from `macro_file`"""
+    module_file = getattr(module, "__file__", None)
+    return (module_file is not None
+            and os.path.realpath(module_file) == os.path.realpath(macro_file))
+
+def _load_macro(module_name, macro_path):
+    """Load `module_name` straight from its file, skipping the sys.path search"""
+    macro_file = _macro_file(module_name, macro_path)
+    if not os.path.isfile(macro_file):
+        import FreeCAD
+
+        FreeCAD.Console.PrintError(f"Macro file not found: {macro_file}\n")
+        return None
+
+    # Macros split over several files still import their siblings by name
+    if _has_sibling_modules(macro_path, module_name):
+        add_macro_path(macro_path)
+
+    spec = importlib.util.spec_from_file_location(module_name, macro_file)
+    module = importlib.util.module_from_spec(spec)
+    previous = sys.modules.get(module_name)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Leave whatever held the name before (if anything) in place
+        if previous is None:
+            del sys.modules[module_name]
+        else:
+            sys.modules[module_name] = previous
+        raise
+    return module
+
+def get_or_load(module_name, macro_path):
+    """Return macro module `module_name`, loading it on first use (None if missing)"""
+    module = _macro_modules.get(module_name)
+    if module is None:
+        # Reuse a module already imported elsewhere before touching the disk,
+        # but only if it is this macro and not another module of the same name
+        module = sys.modules.get(module_name)
+        if module is not None and not _loaded_from(module, _macro_file(module_name, macro_path)):
+            module = None
+        if module is None:
+            module = _load_macro(module_name, macro_path)
+            if module is None:
+                return None
+        else:
+            # The macro may still import sibling modules from its directory
+            add_macro_path(macro_path)
+        _macro_modules[module_name] = module
+    elif DEV_RELOAD:
+        # importlib.reload() would search sys.path, so re-execute the file
+        module = _load_macro(module_name, macro_path)
+        if module is None:
+            return None
+        _macro_modules[module_name] = module
+    return module
+
+def run_macro(macro_path, module_name, entry=None):
+    """Import a macro module once and call its entry function, if given"""
+    module = get_or_load(module_name, macro_path)
+    if module is not None and entry is not None:
+        getattr(module, entry)()
+    return module
+
+def _detessellate_wb_callback():
+    """Show each managed toolbar only in the workbench it belongs to"""
+    import FreeCAD
+    import FreeCADGui
+
+    try:
+        mw = FreeCADGui.getMainWindow()
+        current_wb = FreeCADGui.activeWorkbench()
+        # Resolve the active workbench once per signal, not once per toolbar
+        name = type(current_wb).__name__ if current_wb else ""
+        for toolbar, workbench in mw._detessellate_managed_toolbars:
+            toolbar.setVisible(name == workbench)
+    except Exception as e:
+        FreeCAD.Console.PrintWarning(f"Error in workbench toggle: {e}\n")
+
+def register_workbench_toolbar(mw, toolbar, workbench):
+    """Show `toolbar` only while the workbench class `workbench` is active"""
+    if not hasattr(mw, '_detessellate_managed_toolbars'):
+        mw._detessellate_managed_toolbars = []
+    mw._detessellate_managed_toolbars.append((toolbar, workbench))
+
+    # One connection serves every managed toolbar
+    if not getattr(mw, '_detessellate_wb_connected', False):
+        mw.workbenchActivated.connect(_detessellate_wb_callback)
+        mw._detessellate_wb_connected = True
@@ -5,13 +5,35 @@ import Sketcher
 import PartDesign
 from PySide.QtWidgets import QDockWidget, QWidget, QVBoxLayout, QPushButton, QTextEdit, QLabel, QInputDialog, QLineEdit
 from PySide.QtCore import Qt
+import math
+import numpy as np
 import time
 
+def unique_points(points, tol):
+    """Return points in order, dropping any closer than tol to a point already kept
+
+    Kept points are bucketed in a grid of tol-sized cells, so each point is
+    only compared against the 27 cells around it instead of every kept point.
+    """
+    tol_sq = tol * tol
+    cells = {}
+    unique = []
+    for p in points:
+        cell = (math.floor(p.x / tol), math.floor(p.y / tol), math.floor(p.z / tol))
+        near = (q for dx in (-1, 0, 1) for dy in (-1, 0, 1) for dz in (-1, 0, 1)
+                for q in cells.get((cell[0] + dx, cell[1] + dy, cell[2] + dz), ()))
+        if not any((p.x - q.x) ** 2 + (p.y - q.y) ** 2 + (p.z - q.z) ** 2 < tol_sq for q in near):
+            unique.append(p)
+            cells.setdefault(cell, []).append(p)
+    return unique
+
 class EdgeDataCollector(QDockWidget):
     def __init__(self):
         super().__init__("CoplanarSketch")
         self.setWidget(self.create_ui())
         self.collected_edges = []
+        self.edges_by_name = {}
+        self.edge_points = np.empty((0, 2, 3))
         self.edge_mass_center = FreeCAD.Vector(0, 0, 0)
 
     def create_ui(self):
@@ -76,13 +98,12 @@ class EdgeDataCollector(QDockWidget):
 
         # Collect edges with validity checking
         self.collected_edges = []
+        self.edges_by_name = {}
         invalid_count = 0
         degenerate_count = 0
         property_error_count = 0
 
-        for edge in edges:
-            edge_index = edges.index(edge)  # Get actual FreeCAD edge index
-
+        for edge_index, edge in enumerate(edges):  # Position gives the FreeCAD edge index
             # Cache vertex points to avoid repeated API calls
             try:
                 vertex_points = [v.Point for v in edge.Vertexes]
@@ -118,6 +139,14 @@ class EdgeDataCollector(QDockWidget):
                     invalid_count += 1
 
             self.collected_edges.append(edge_dict)
+            self.edges_by_name[edge_dict['name']] = edge_dict
+
+        # Endpoints as an (N, 2, 3) array for the coplanarity test; edges without
+        # exactly two vertices keep NaN rows, which never compare as coplanar
+        self.edge_points = np.full((len(self.collected_edges), 2, 3), np.nan)
+        for i, edge_dict in enumerate(self.collected_edges):
+            if edge_dict['vertex_count'] == 2:
+                self.edge_points[i] = [(p.x, p.y, p.z) for p in edge_dict['vertex_points']]
 
         # Calculate mass center from valid edges only
         all_points = [point for edge_dict in self.collected_edges
@@ -186,8 +215,8 @@ class EdgeDataCollector(QDockWidget):
             edge2_name = selected_edge_names[1]
 
             # Find edges in our collected data
-            edge1_dict = next((ed for ed in self.collected_edges if ed['name'] == edge1_name), None)
-            edge2_dict = next((ed for ed in self.collected_edges if ed['name'] == edge2_name), None)
+            edge1_dict = self.edges_by_name.get(edge1_name)
+            edge2_dict = self.edges_by_name.get(edge2_name)
 
             if not edge1_dict or not edge2_dict:
                 self.info_display.append("Error: Selected edges not found in collected data.")
@@ -199,10 +228,7 @@ class EdgeDataCollector(QDockWidget):
 
             # Collect all unique vertices from both edges
             all_vertices = edge1_dict['vertex_points'] + edge2_dict['vertex_points']
-            unique_vertices = []
-            for v in all_vertices:
-                if not any((v - existing).Length < 1e-6 for existing in unique_vertices):
-                    unique_vertices.append(v)
+            unique_vertices = unique_points(all_vertices, 1e-6)
 
             if len(unique_vertices) < 3:
                 self.info_display.append("Error: Edges are colinear; cannot define plane.")
@@ -223,19 +249,19 @@ class EdgeDataCollector(QDockWidget):
             self.info_display.append("Error: Select either a face or two edges.")
             return
 
-        def is_coplanar(edge_dict):
-            if edge_dict['vertex_count'] != 2:
-                return False
-            v1, v2 = edge_dict['vertex_points']
-            try:
-                # Clamp user input between 1e-6 and 1.0
-                tol = max(1e-6, min(float(self.tolerance_input.text()), 1.0))
-            except:
-                tol = 1e-6  # fallback if input is invalid
-            return abs((v1 - plane_point).dot(plane_normal)) < tol and \
-                   abs((v2 - plane_point).dot(plane_normal)) < tol
-
-        coplanar_edge_dicts = [edge_dict for edge_dict in self.collected_edges if is_coplanar(edge_dict)]
+        try:
+            # Clamp user input between 1e-6 and 1.0
+            tol = max(1e-6, min(float(self.tolerance_input.text()), 1.0))
+        except:
+            tol = 1e-6  # fallback if input is invalid
+
+        # Distances of both endpoints of every edge to the plane in one go
+        normal = np.array([plane_normal.x, plane_normal.y, plane_normal.z])
+        origin = np.array([plane_point.x, plane_point.y, plane_point.z])
+        distances = np.abs((self.edge_points - origin) @ normal)
+        coplanar_indices = np.flatnonzero((distances < tol).all(axis=1))
+
+        coplanar_edge_dicts = [self.collected_edges[i] for i in coplanar_indices]
         coplanar_edges = [edge_dict['edge'] for edge_dict in coplanar_edge_dicts]
 
         # Validate coplanar results
@@ -259,17 +285,25 @@ class EdgeDataCollector(QDockWidget):
             return FreeCAD.Vector(0, 0, 1), FreeCAD.Vector(0, 0, 0)
 
         center = sum(vertices, FreeCAD.Vector()).multiply(1.0 / len(vertices))
-        vectors = [v.sub(center) for v in vertices]
+        points = np.array([(v.x, v.y, v.z) for v in vertices])
+
+        # Anchored triangle: first vertex, the vertex farthest from it and the
+        # one spanning the largest area with those two. No area means collinear.
+        offsets = points - points[0]
+        j = int(np.argmax(np.einsum('ij,ij->i', offsets, offsets)))
+        crosses = np.cross(offsets[j], offsets)
+        k = int(np.argmax(np.einsum('ij,ij->i', crosses, crosses)))
 
         best_normal = None
-        best_magnitude = 0
-        for i in range(len(vectors)):
-            for j in range(i+1, len(vectors)):
-                for k in range(j+1, len(vectors)):
-                    n = (vectors[j] - vectors[i]).cross(vectors[k] - vectors[i])
-                    if n.Length > best_magnitude:
-                        best_magnitude = n.Length
-                        best_normal = n.normalize()
+        if crosses[k].any():
+            # Best-fit plane normal: direction of least spread of the centered points
+            _, _, vt = np.linalg.svd(points - points.mean(axis=0), full_matrices=False)
+            normal = vt[-1]
+            # Orient it like the triangle's normal, taken with vertices in selection order
+            reference = crosses[k] if j < k else -crosses[k]
+            if normal.dot(reference) < 0:
+                normal = -normal
+            best_normal = FreeCAD.Vector(*normal).normalize()
 
         if not best_normal:
             best_normal = FreeCAD.Vector(0, 0, 1)
@@ -313,21 +347,26 @@ class EdgeDataCollector(QDockWidget):
         edge_signatures = set()
         duplicate_edges = 0
 
-        # Add all geometry first (this is the slow part for large sketches)
-        geo_count = 0
+        # Collect all geometry first (this is the slow part for large sketches)
+        geos = []
+        endpoints = []
         for i, edge in enumerate(edges):
             if i % 500 == 0 and i > 0:
-                FreeCAD.Console.PrintMessage(f"DEBUG: Added {i}/{len(edges)} geometries\n")
+                FreeCAD.Console.PrintMessage(f"DEBUG: Prepared {i}/{len(edges)} geometries\n")
 
             v_start, v_end = edge.Vertexes[0].Point, edge.Vertexes[-1].Point
             if (v_start - v_end).Length < tolerance:
                 continue  # Skip degenerate
 
+            # Read the coordinates once; Vector attribute access is not free
+            vs = (v_start.x, v_start.y, v_start.z)
+            ve = (v_end.x, v_end.y, v_end.z)
+
             # Create signature to detect duplicate edges (check both directions)
-            sig1 = (round(v_start.x, 4), round(v_start.y, 4), round(v_start.z, 4),
-                    round(v_end.x, 4), round(v_end.y, 4), round(v_end.z, 4))
-            sig2 = (round(v_end.x, 4), round(v_end.y, 4), round(v_end.z, 4),
-                    round(v_start.x, 4), round(v_start.y, 4), round(v_start.z, 4))
+            start_sig = (round(vs[0], 4), round(vs[1], 4), round(vs[2], 4))
+            end_sig = (round(ve[0], 4), round(ve[1], 4), round(ve[2], 4))
+            sig1 = start_sig + end_sig
+            sig2 = end_sig + start_sig
 
             if sig1 in edge_signatures or sig2 in edge_signatures:
                 duplicate_edges += 1
@@ -337,13 +376,17 @@ class EdgeDataCollector(QDockWidget):
             v_start_local = inverse_placement.multVec(v_start)
             v_end_local = inverse_placement.multVec(v_end)
 
-            geo_index = final_sketch.addGeometry(Part.LineSegment(v_start_local, v_end_local), False)
-            final_sketch.setConstruction(geo_index, True)
-            geo_count += 1
+            geos.append(Part.LineSegment(v_start_local, v_end_local))
+            endpoints.append((vs, ve))
+
+        # One addGeometry() call adds the whole batch as construction geometry
+        geo_indices = final_sketch.addGeometry(geos, True) if geos else []
+        geo_count = len(geo_indices)
 
-            # Build edge map for constraints
-            for point, vid in [(v_start, 1), (v_end, 2)]:
-                key = (round(point.x, 5), round(point.y, 5), round(point.z, 5))
+        # Build edge map for constraints
+        for geo_index, (vs, ve) in zip(geo_indices, endpoints):
+            for point, vid in [(vs, 1), (ve, 2)]:
+                key = (round(point[0], 5), round(point[1], 5), round(point[2], 5))
                 edge_map.setdefault(key, []).append((geo_index, vid))
 
         FreeCAD.Console.PrintMessage(f"DEBUG: All {geo_count} geometries added ({duplicate_edges} duplicates skipped), now adding constraints\n")
@@ -351,12 +394,7 @@ class EdgeDataCollector(QDockWidget):
         # Add critical constraints only (fast mode for all sketch sizes)
         constraint_count, skipped_count = self._add_critical_constraints_fast(final_sketch, edge_map, len(edges))
 
-        FreeCAD.Console.PrintMessage(f"DEBUG: Constraints added, calling recompute\n")
-
-        # Single recompute at the end
-        doc.recompute()
-
-        FreeCAD.Console.PrintMessage(f"DEBUG: Recompute complete, returning sketch with stats\n")
+        FreeCAD.Console.PrintMessage(f"DEBUG: Constraints added, returning sketch with stats\n")
 
         # Return sketch and constraint info separately (can't set arbitrary attributes on Sketcher objects)
         return final_sketch, constraint_count, skipped_count
@@ -385,7 +423,7 @@ class EdgeDataCollector(QDockWidget):
         final_sketch.AttachmentOffset.Rotation = temp_sketch.Placement.Rotation
         final_sketch.Placement = FreeCAD.Placement()
 
-        doc.recompute()  # Needed to resolve attachment before adding geometry
+        final_sketch.recomputeFeature()  # Needed to resolve attachment before adding geometry
 
         # Cache the inverse placement once
         inverse_placement = final_sketch.getGlobalPlacement().inverse()
@@ -399,21 +437,26 @@ class EdgeDataCollector(QDockWidget):
         edge_signatures = set()
         duplicate_edges = 0
 
-        # Add all geometry first
-        geo_count = 0
+        # Collect all geometry first
+        geos = []
+        endpoints = []
         for i, edge in enumerate(edges):
             if i % 500 == 0 and i > 0:
-                FreeCAD.Console.PrintMessage(f"DEBUG: Added {i}/{len(edges)} geometries\n")
+                FreeCAD.Console.PrintMessage(f"DEBUG: Prepared {i}/{len(edges)} geometries\n")
 
             v_start, v_end = edge.Vertexes[0].Point, edge.Vertexes[-1].Point
             if (v_start - v_end).Length < tolerance:
                 continue
 
+            # Read the coordinates once; Vector attribute access is not free
+            vs = (v_start.x, v_start.y, v_start.z)
+            ve = (v_end.x, v_end.y, v_end.z)
+
             # Create signature to detect duplicate edges (check both directions)
-            sig1 = (round(v_start.x, 4), round(v_start.y, 4), round(v_start.z, 4),
-                    round(v_end.x, 4), round(v_end.y, 4), round(v_end.z, 4))
-            sig2 = (round(v_end.x, 4), round(v_end.y, 4), round(v_end.z, 4),
-                    round(v_start.x, 4), round(v_start.y, 4), round(v_start.z, 4))
+            start_sig = (round(vs[0], 4), round(vs[1], 4), round(vs[2], 4))
+            end_sig = (round(ve[0], 4), round(ve[1], 4), round(ve[2], 4))
+            sig1 = start_sig + end_sig
+            sig2 = end_sig + start_sig
 
             if sig1 in edge_signatures or sig2 in edge_signatures:
                 duplicate_edges += 1
@@ -423,12 +466,17 @@ class EdgeDataCollector(QDockWidget):
             v_start_local = inverse_placement.multVec(v_start)
             v_end_local = inverse_placement.multVec(v_end)
 
-            geo_index = final_sketch.addGeometry(Part.LineSegment(v_start_local, v_end_local), False)
-            final_sketch.setConstruction(geo_index, True)
-            geo_count += 1
+            geos.append(Part.LineSegment(v_start_local, v_end_local))
+            endpoints.append((vs, ve))
 
-            for point, vid in [(v_start, 1), (v_end, 2)]:
-                key = (round(point.x, 5), round(point.y, 5), round(point.z, 5))
+        # One addGeometry() call adds the whole batch as construction geometry
+        geo_indices = final_sketch.addGeometry(geos, True) if geos else []
+        geo_count = len(geo_indices)
+
+        # Build edge map for constraints
+        for geo_index, (vs, ve) in zip(geo_indices, endpoints):
+            for point, vid in [(vs, 1), (ve, 2)]:
+                key = (round(point[0], 5), round(point[1], 5), round(point[2], 5))
                 edge_map.setdefault(key, []).append((geo_index, vid))
 
         FreeCAD.Console.PrintMessage(f"DEBUG: All {geo_count} geometries added ({duplicate_edges} duplicates skipped), now adding constraints\n")
@@ -436,12 +484,7 @@ class EdgeDataCollector(QDockWidget):
         # Add critical constraints only (fast mode for all sketch sizes)
         constraint_count, skipped_count = self._add_critical_constraints_fast(final_sketch, edge_map, len(edges))
 
-        FreeCAD.Console.PrintMessage(f"DEBUG: Constraints added ({constraint_count} added, {skipped_count} skipped), calling recompute\n")
-
-        # Single recompute at the end
-        doc.recompute()
-
-        FreeCAD.Console.PrintMessage(f"DEBUG: Recompute complete, returning sketch with stats\n")
+        FreeCAD.Console.PrintMessage(f"DEBUG: Constraints added ({constraint_count} added, {skipped_count} skipped), returning sketch with stats\n")
 
         # Return sketch and constraint info separately (can't set arbitrary attributes on Sketcher objects)
         return final_sketch, constraint_count, skipped_count
@@ -463,21 +506,32 @@ class EdgeDataCollector(QDockWidget):
 
         # Only add ONE constraint per group (connect first to second only)
         # This maintains connectivity while avoiding constraint explosion
+        constraints = []
         for group in edge_map.values():
             if len(group) > 1:
                 base = group[0]
                 other = group[1]
+                constraints.append(Sketcher.Constraint('Coincident', base[0], base[1], other[0], other[1]))
+
+                # Skip the rest of the group to avoid redundant constraints
+                skipped_count += len(group) - 2
+
+        # Hand the whole batch to the sketch in one call
+        try:
+            if constraints:
+                sketch.addConstraint(constraints)
+            constraint_count = len(constraints)
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(f"Batch constraint add failed, adding one by one: {e}\n")
+            for constraint in constraints:
                 try:
-                    sketch.addConstraint(Sketcher.Constraint('Coincident', base[0], base[1], other[0], other[1]))
+                    sketch.addConstraint(constraint)
                     constraint_count += 1
                 except Exception as e:
                     failed_count += 1
                     if failed_count < 5:  # Print first few failures for debugging
                         FreeCAD.Console.PrintWarning(f"Constraint failed: {e}\n")
 
-                # Skip the rest of the group to avoid redundant constraints
-                skipped_count += len(group) - 2
-
         # Re-enable automatic solving
         if hasattr(sketch, 'setAutomaticSolve'):
             try:
@@ -569,22 +623,7 @@ class EdgeDataCollector(QDockWidget):
 
             # Optimize vertex collection - don't create intermediate list of all vertices
             FreeCAD.Console.PrintMessage("DEBUG: Collecting unique vertices\n")
-            unique_vertices = []
-            tolerance_sq = 1e-8  # Use squared distance to avoid sqrt calls
-
-            for edge in selected_edges:
-                for v in edge.Vertexes:
-                    p = v.Point
-                    # Check if this point is already in our list using squared distance
-                    is_duplicate = False
-                    for q in unique_vertices:
-                        # Squared distance comparison is much faster than .Length
-                        dx, dy, dz = p.x - q.x, p.y - q.y, p.z - q.z
-                        if (dx*dx + dy*dy + dz*dz) < tolerance_sq:
-                            is_duplicate = True
-                            break
-                    if not is_duplicate:
-                        unique_vertices.append(p)
+            unique_vertices = unique_points((v.Point for edge in selected_edges for v in edge.Vertexes), 1e-4)
 
             FreeCAD.Console.PrintMessage(f"DEBUG: Found {len(unique_vertices)} unique vertices\n")
 
@@ -607,7 +646,6 @@ class EdgeDataCollector(QDockWidget):
             FreeCAD.Console.PrintMessage("DEBUG: Creating temp sketch\n")
             temp_sketch = doc.addObject("Sketcher::SketchObject", "TempSketch")
             temp_sketch.Placement = placement
-            doc.recompute()
             FreeCAD.Console.PrintMessage("DEBUG: Temp sketch created\n")
 
             # Create sketch based on user choice
@@ -635,20 +673,20 @@ class EdgeDataCollector(QDockWidget):
                     return
                 final_sketch, constraint_count, skipped_count = self.create_body_sketch(temp_sketch, selected_edges, target_body)
 
-            doc.recompute()
-            FreeCADGui.Selection.clearSelection()
-            FreeCADGui.Selection.addSelection(final_sketch)
-            FreeCADGui.activeDocument().activeView().viewAxonometric()
-            FreeCADGui.activeDocument().activeView().fitAll()
-
             # Clean up temporary sketch now that we're done
             try:
                 if temp_sketch is not None:
                     doc.removeObject(temp_sketch.Name)
-                    doc.recompute()
             except Exception as e:
                 FreeCAD.Console.PrintWarning(f"Could not remove temporary sketch: {e}\n")
 
+            # Single document recompute for the whole operation
+            doc.recompute()
+            FreeCADGui.Selection.clearSelection()
+            FreeCADGui.Selection.addSelection(final_sketch)
+            FreeCADGui.activeDocument().activeView().viewAxonometric()
+            FreeCADGui.activeDocument().activeView().fitAll()
+
             # Report constraint statistics
             if constraint_count > 0:
                 self.info_display.append(f"Added {constraint_count} coincident constraints.")
@@ -758,4 +796,5 @@ def show_edge_data_collector_docker():
             d.deleteLater()
     mw.addDockWidget(Qt.RightDockWidgetArea, EdgeDataCollector())
 
-show_edge_data_collector_docker()
+if __name__ == "__main__":
+    show_edge_data_collector_docker()
@@ -395,4 +395,5 @@ def select_connected_loop_or_sketch():
     FreeCAD.Console.PrintMessage(f"Selected {len(all_edges_to_select)} edges from {len(unique_loop_sets)} loop(s).\n")
 
 # --- Run the macro ---
-select_connected_loop_or_sketch()
+if __name__ == "__main__":
+    select_connected_loop_or_sketch()
@@ -523,4 +523,5 @@ def add_line_distance_constraints(sketch, geo_indices):
 
 
 # Run the macro
-edge_loop_to_sketch()
\ No newline at end of file
+if __name__ == "__main__":
+    edge_loop_to_sketch()
\ No newline at end of file
@@ -162,12 +162,16 @@ class MeshPlacementDock(QtGui.QDockWidget):
         doc.commitTransaction()
         FreeCAD.Console.PrintMessage(f"Objects aligned ({mode}).\n")
 
-# --- Ensure only one dock instance ---
-mw = FreeCADGui.getMainWindow()
-for dock in mw.findChildren(QtGui.QDockWidget):
-    if dock.objectName() == "MeshPlacement":
-        mw.removeDockWidget(dock)
-        dock.deleteLater()
-
-dock = MeshPlacementDock()
-mw.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
+def show_mesh_placement_dock():
+    # --- Ensure only one dock instance ---
+    mw = FreeCADGui.getMainWindow()
+    for dock in mw.findChildren(QtGui.QDockWidget):
+        if dock.objectName() == "MeshPlacement":
+            mw.removeDockWidget(dock)
+            dock.deleteLater()
+
+    dock = MeshPlacementDock()
+    mw.addDockWidget(QtCore.Qt.RightDockWidgetArea, dock)
+
+if __name__ == "__main__":
+    show_mesh_placement_dock()
@@ -3,335 +3,474 @@ import FreeCADGui as Gui
 from PySide import QtCore, QtGui
 import Part
 import math
+import numpy as np
+from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Any
 
 
-class GeometryMatcher:
-    """Handles geometric matching logic for faces, edges, and vertices."""
+# Geometry TypeId -> small integer code, so type checks become integer compares
+_TYPE_CODES: Dict[str, int] = {}
 
-    TOLERANCE = 1e-6
 
-    @staticmethod
-    def faces_exact_match(face1: Part.Face, face2: Part.Face) -> bool:
-        """Check if two faces are exact matches."""
-        try:
-            # Check surface type
-            if face1.Surface.TypeId != face2.Surface.TypeId:
-                return False
+def _type_code(type_id: str) -> int:
+    """Return the integer code for a surface/curve TypeId."""
+    return _TYPE_CODES.setdefault(type_id, len(_TYPE_CODES))
 
-            # Check area
-            if abs(face1.Area - face2.Area) > GeometryMatcher.TOLERANCE:
-                return False
 
-            # Check center of mass
-            com1 = face1.CenterOfMass
-            com2 = face2.CenterOfMass
-            if com1.distanceToPoint(com2) > GeometryMatcher.TOLERANCE:
-                return False
+_LINE = _type_code("Part::GeomLine")
+_CIRCLE = _type_code("Part::GeomCircle")
 
-            # Check normal vectors for planar faces
-            if hasattr(face1.Surface, 'Axis') and hasattr(face2.Surface, 'Axis'):
-                if abs(face1.Surface.Axis.dot(face2.Surface.Axis)) < (1 - GeometryMatcher.TOLERANCE):
-                    return False
+# Surfaces that carry an Axis, so face_record() needs no attribute probe
+_HAS_AXIS_TYPES = frozenset({
+    "Part::GeomPlane", "Part::GeomCylinder", "Part::GeomCone",
+    "Part::GeomSphere", "Part::GeomToroid",
+})
 
-            return True
 
-        except Exception:
-            return False
+def _xyz(v) -> Tuple[float, float, float]:
+    """Return the coordinates of a FreeCAD Vector as a plain tuple."""
+    return (v.x, v.y, v.z)
 
-    @staticmethod
-    def faces_similar_match(face1: Part.Face, face2: Part.Face) -> bool:
-        """
-        Check if two faces are similar.
-        For planar faces: only coplanarity.
-        For non-planar faces: 3D bounding box overlap.
-        """
-        try:
-            is_face1_planar = (face1.Surface.TypeId == "Part::GeomPlane")
-            is_face2_planar = (face2.Surface.TypeId == "Part::GeomPlane")
-
-            if is_face1_planar and is_face2_planar:
-                # Both faces are planar: check only coplanarity as requested
-                # Check if coplanar (normal vectors parallel)
-                normal1 = face1.Surface.Axis
-                normal2 = face2.Surface.Axis
-                if abs(normal1.dot(normal2)) < (1 - GeometryMatcher.TOLERANCE):
-                    return False
-
-                # Check if on same plane
-                point1 = face1.Surface.Position
-                point2 = face2.Surface.Position
-                distance = abs(normal1.dot(point2 - point1))
-                if distance > GeometryMatcher.TOLERANCE:
-                    return False
-
-                return True # Coplanar faces are considered similar as per new relaxed criteria
-
-            else:
-                # At least one face is non-planar (or both are non-planar): use 3D bounding box overlap
-                bb1 = face1.BoundBox
-                bb2 = face2.BoundBox
 
-                if bb1.isNull() or bb2.isNull():
-                    return False
-                
-                intersected_bb = bb1.intersect(bb2)
-                return not intersected_bb.isNull()
+def _sq_norms(rows: np.ndarray) -> np.ndarray:
+    """Return the squared lengths of the rows of an (N, 3) array."""
+    return np.einsum('ij,ij->i', rows, rows)
 
-        except Exception:
-            return False
-
-    @staticmethod
-    def edges_exact_match(edge1: Part.Edge, edge2: Part.Edge) -> bool:
-        """Check if two edges are exact matches."""
-        try:
-            is_circle1 = edge1.Curve.TypeId == "Part::GeomCircle"
-            is_circle2 = edge2.Curve.TypeId == "Part::GeomCircle"
 
-            if is_circle1 and is_circle2:
-                center1 = edge1.Curve.Center
-                center2 = edge2.Curve.Center
-                if center1.distanceToPoint(center2) > GeometryMatcher.TOLERANCE:
-                    return False
+def _unwrap_end(start, end):
+    """Return arc ends, moving an end below its start forward by whole turns."""
+    return np.where(end < start, start + np.mod(end - start, 2 * math.pi), end)
 
-                radius1 = edge1.Curve.Radius
-                radius2 = edge2.Curve.Radius
-                if abs(radius1 - radius2) > GeometryMatcher.TOLERANCE:
-                    return False
 
-                if hasattr(edge1.Curve, 'Axis') and hasattr(edge2.Curve, 'Axis'):
-                    axis1 = edge1.Curve.Axis
-                    axis2 = edge2.Curve.Axis
-                    if abs(axis1.dot(axis2)) < (1 - GeometryMatcher.TOLERANCE):
-                        return False
-
-                # Compare angular span
-                a1s = edge1.Curve.FirstParameter
-                a1e = edge1.Curve.LastParameter
-                a2s = edge2.Curve.FirstParameter
-                a2e = edge2.Curve.LastParameter
-
-                # Normalize angles
-                while a1e < a1s:
-                    a1e += 2 * math.pi
-                while a2e < a2s:
-                    a2e += 2 * math.pi
-
-                angle1 = abs(a1e - a1s)
-                angle2 = abs(a2e - a2s)
-
-                if abs(angle1 - angle2) > GeometryMatcher.TOLERANCE:
-                    return False
-
-                # Ensure endpoints match in either direction
-                if len(edge1.Vertexes) < 2 or len(edge2.Vertexes) < 2:
-                    return False
-
-                start1, end1 = edge1.Vertexes[0].Point, edge1.Vertexes[1].Point
-                start2, end2 = edge2.Vertexes[0].Point, edge2.Vertexes[1].Point
-
-                forward = (start1.distanceToPoint(start2) < GeometryMatcher.TOLERANCE and
-                           end1.distanceToPoint(end2) < GeometryMatcher.TOLERANCE)
-                reverse = (start1.distanceToPoint(end2) < GeometryMatcher.TOLERANCE and
-                           end1.distanceToPoint(start2) < GeometryMatcher.TOLERANCE)
-
-                return forward or reverse
-
-            # Fallback for non-circular edges
-            if edge1.Curve.TypeId != edge2.Curve.TypeId:
-                return False
+class GeometryMatcher:
+    """Tolerances shared by the face, edge and vertex matchers."""
 
-            if abs(edge1.Length - edge2.Length) > GeometryMatcher.TOLERANCE:
-                return False
+    TOLERANCE = 1e-6
+    # Distances are compared squared in the array code to skip the square roots
+    TOLERANCE_SQ = TOLERANCE * TOLERANCE
 
-            if len(edge1.Vertexes) < 2 or len(edge2.Vertexes) < 2:
-                return False
 
-            start1, end1 = edge1.Vertexes[0].Point, edge1.Vertexes[1].Point
-            start2, end2 = edge2.Vertexes[0].Point, edge2.Vertexes[1].Point
+class FeatureAnalyzer:
+    """Analyzes features in a body to extract geometric elements."""
 
-            forward_match = (start1.distanceToPoint(start2) < GeometryMatcher.TOLERANCE and
-                             end1.distanceToPoint(end2) < GeometryMatcher.TOLERANCE)
-            reverse_match = (start1.distanceToPoint(end2) < GeometryMatcher.TOLERANCE and
-                             end1.distanceToPoint(start2) < GeometryMatcher.TOLERANCE)
+    @staticmethod
+    def get_body_features(body: Any) -> List[Any]:
+        """Get all features in a body ordered by creation sequence."""
+        features = []
+        if hasattr(body, 'Group'):
+            for obj in body.Group:
+                if hasattr(obj, 'Shape') and obj.Shape:
+                    features.append(obj)
+        return features
 
-            return forward_match or reverse_match
+    @staticmethod
+    def extract_faces(feature: Any) -> List[Part.Face]:
+        """Return the faces of a feature; the i-th one is named f"Face{i + 1}"."""
+        if hasattr(feature, 'Shape') and feature.Shape:
+            return feature.Shape.Faces
+        return []
 
-        except Exception:
-            return False
+    @staticmethod
+    def extract_edges(feature: Any) -> List[Part.Edge]:
+        """Return the edges of a feature; the i-th one is named f"Edge{i + 1}"."""
+        if hasattr(feature, 'Shape') and feature.Shape:
+            return feature.Shape.Edges
+        return []
 
+    @staticmethod
+    def extract_vertices(feature: Any) -> List[Part.Vertex]:
+        """Return the vertices of a feature; the i-th one is named f"Vertex{i + 1}"."""
+        if hasattr(feature, 'Shape') and feature.Shape:
+            return feature.Shape.Vertexes
+        return []
+
+
+@dataclass
+class FeatureGeomCache:
+    """
+    Face geometry of one feature as structure-of-arrays.
+    Every face is read once, so matching becomes NumPy masks instead of
+    Shape property reads per face pair across the Python/C++ boundary.
+    """
+
+    faces: List[Part.Face]
+    valid: np.ndarray       # bool[N], False where the face could not be read
+    typeids: np.ndarray     # int[N] surface type codes
+    areas: np.ndarray       # float[N]
+    coms: np.ndarray        # float[N, 3] centers of mass
+    has_axis: np.ndarray    # bool[N]
+    axes: np.ndarray        # float[N, 3] surface axes (zero without an axis)
+    planar: np.ndarray      # bool[N]
+    positions: np.ndarray   # float[N, 3] plane positions (zero if not planar)
+    bbox_valid: np.ndarray  # bool[N]
+    bbox_min: np.ndarray    # float[N, 3]
+    bbox_max: np.ndarray    # float[N, 3]
+    bounds: Optional[Tuple[np.ndarray, np.ndarray]] = None  # union of all face boxes
 
     @staticmethod
-    def edges_similar_match(edge1: Part.Edge, edge2: Part.Edge) -> bool:
-        """Check if two edges are similar (collinear with overlapping positions for lines, or same plane, radius, center for arcs)."""
+    def face_record(face: Part.Face) -> Optional[tuple]:
+        """
+        Read everything the face tests use in one pass.
+        Returns (type code, area, com, axis or None, planar, position, bbox or None),
+        or None if the face could not be read.
+        """
         try:
-            # Check if both are lines
-            if edge1.Curve.TypeId == "Part::GeomLine" and edge2.Curve.TypeId == "Part::GeomLine":
-                return GeometryMatcher._check_line_similarity(edge1, edge2)
-
-            # Check if both are circles/arcs
-            elif edge1.Curve.TypeId == "Part::GeomCircle" and edge2.Curve.TypeId == "Part::GeomCircle":
-                return GeometryMatcher._check_circle_similarity(edge1, edge2)
-
-            # For other curve types, they are not considered "similar" based on the strict criteria.
-            return False
-
+            surface = face.Surface
+            type_id = surface.TypeId
+            planar = type_id == "Part::GeomPlane"
+            axis = _xyz(surface.Axis) if type_id in _HAS_AXIS_TYPES else None
+            position = _xyz(surface.Position) if planar else (0.0, 0.0, 0.0)
+            bb = face.BoundBox
+            bbox = None if bb.isNull() else ((bb.XMin, bb.YMin, bb.ZMin), (bb.XMax, bb.YMax, bb.ZMax))
+            return (_type_code(type_id), face.Area, _xyz(face.CenterOfMass), axis, planar, position, bbox)
         except Exception:
-            return False
+            return None
+
+    @classmethod
+    def build(cls, feature: Any) -> 'FeatureGeomCache':
+        """Extract the face arrays of a feature."""
+        faces = FeatureAnalyzer.extract_faces(feature)
+        records = [cls.face_record(face) for face in faces]
+
+        n = len(records)
+        geom = cls(
+            faces=faces,
+            valid=np.zeros(n, dtype=bool),
+            typeids=np.full(n, -1, dtype=np.int64),
+            areas=np.zeros(n),
+            coms=np.zeros((n, 3)),
+            has_axis=np.zeros(n, dtype=bool),
+            axes=np.zeros((n, 3)),
+            planar=np.zeros(n, dtype=bool),
+            positions=np.zeros((n, 3)),
+            bbox_valid=np.zeros(n, dtype=bool),
+            bbox_min=np.zeros((n, 3)),
+            bbox_max=np.zeros((n, 3)),
+        )
+        for i, record in enumerate(records):
+            if record is None:
+                continue
+            type_code, area, com, axis, planar, position, bbox = record
+            geom.valid[i] = True
+            geom.typeids[i] = type_code
+            geom.areas[i] = area
+            geom.coms[i] = com
+            if axis is not None:
+                geom.has_axis[i] = True
+                geom.axes[i] = axis
+            geom.planar[i] = planar
+            geom.positions[i] = position
+            if bbox is not None:
+                geom.bbox_valid[i] = True
+                geom.bbox_min[i], geom.bbox_max[i] = bbox
+        # Only usable when every readable face has a box to contribute
+        if geom.bbox_valid.any() and not (geom.valid & ~geom.bbox_valid).any():
+            geom.bounds = (geom.bbox_min[geom.bbox_valid].min(axis=0),
+                           geom.bbox_max[geom.bbox_valid].max(axis=0))
+        return geom
+
+    def match_faces(self, current: Optional[tuple]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the indices of exact and similar matches for a face record.
+        Exact: same surface type, area and center of mass, with parallel axes
+        when both surfaces have one. Similar: coplanar if both faces are
+        planar, otherwise overlapping bounding boxes. Faces matching exactly
+        are not reported as similar.
+        """
+        empty = np.zeros(0, dtype=np.intp)
+        if current is None or not self.faces:
+            return empty, empty
+
+        tol = GeometryMatcher.TOLERANCE
+        type_code, area, com, axis, planar, position, bbox = current
+
+        if not planar and bbox is not None and self.bounds is not None:
+            # A non-planar face only has similar matches inside its own box, and
+            # exact matches have their center of mass (inside their box) within
+            # tolerance of it, so a feature whose faces all lie elsewhere is skipped
+            if not ((self.bounds[0] - tol <= bbox[1]).all()
+                    and (self.bounds[1] + tol >= bbox[0]).all()):
+                return empty, empty
+
+        # Cheap scalar tests first; centers of mass are only compared for the
+        # faces that already agree on type and area
+        exact = (self.valid
+                 & (self.typeids == type_code)
+                 & (np.abs(self.areas - area) <= tol))
+        rows = np.flatnonzero(exact)
+        exact[rows] = _sq_norms(self.coms[rows] - np.asarray(com)) <= GeometryMatcher.TOLERANCE_SQ
+
+        if axis is not None:
+            axis = np.asarray(axis)
+            parallel = np.abs(self.axes @ axis) >= 1 - tol
+            # Normals are only compared when both surfaces have an axis
+            exact &= ~self.has_axis | parallel
+
+        # Non-planar pairs: 3D bounding box overlap
+        if bbox is None:
+            overlap = np.zeros(len(self.faces), dtype=bool)
+        else:
+            cur_min, cur_max = np.asarray(bbox[0]), np.asarray(bbox[1])
+            overlap = (self.bbox_valid
+                       & (self.bbox_min <= cur_max).all(axis=1)
+                       & (self.bbox_max >= cur_min).all(axis=1))
+
+        if planar:
+            # Planar pairs: coplanarity only
+            distance = np.abs((self.positions - np.asarray(position)) @ axis)
+            coplanar = parallel & (distance <= tol)
+            similar = np.where(self.planar, coplanar, overlap)
+        else:
+            similar = overlap
+        similar &= self.valid & ~exact
+
+        return np.flatnonzero(exact), np.flatnonzero(similar)
+
+
+@dataclass
+class FeatureEdgeCache:
+    """
+    Edge geometry of one feature as structure-of-arrays.
+    Curve vectors are converted to NumPy rows once, so the edge tests run as
+    array arithmetic instead of FreeCAD Vector calls per edge pair.
+    """
+
+    edges: List[Part.Edge]
+    valid: np.ndarray       # bool[N], False where the edge could not be read
+    typeids: np.ndarray     # int[N] curve type codes
+    lengths: np.ndarray     # float[N]
+    has_ends: np.ndarray    # bool[N], True with at least two vertices
+    starts: np.ndarray      # float[N, 3] first vertex
+    ends: np.ndarray        # float[N, 3] second vertex
+    centers: np.ndarray     # float[N, 3] circle centers
+    radii: np.ndarray       # float[N]
+    has_axis: np.ndarray    # bool[N] circles with an axis
+    axes: np.ndarray        # float[N, 3]
+    first: np.ndarray       # float[N] circle parameter range
+    last: np.ndarray        # float[N]
+    directions: np.ndarray  # float[N, 3] line directions
+    locations: np.ndarray   # float[N, 3] line locations
 
     @staticmethod
-    def _check_line_similarity(edge1: Part.Edge, edge2: Part.Edge) -> bool:
-        """Check similarity for linear edges (exactly collinear with overlap)."""
+    def edge_record(edge: Part.Edge) -> Optional[tuple]:
+        """
+        Read everything the edge tests use in one pass.
+        Returns (type code, length, (start, end) or None, circle or None, line or None)
+        with circle = (center, radius, axis, first, last) and
+        line = (direction, location), or None if the edge could not be read.
+        """
         try:
-            # Check if collinear (directions are parallel or anti-parallel)
-            dir1 = edge1.Curve.Direction
-            dir2 = edge2.Curve.Direction
-            
-            # Use abs() to account for anti-parallel directions
-            if abs(dir1.dot(dir2)) < (1 - GeometryMatcher.TOLERANCE):
-                return False
-
-            # Check if they lie on the same line (origin of one is on the other's line)
-            line_origin1 = edge1.Curve.Location
-            line_origin2 = edge2.Curve.Location
-            
-            # Use cross product magnitude to check if line_origin2 is on the line of edge1
-            vec_to_origin2 = line_origin2 - line_origin1
-            cross_product_magnitude = vec_to_origin2.cross(dir1).Length
-            
-            if cross_product_magnitude > GeometryMatcher.TOLERANCE:
-                return False
-
-            # Get edge endpoints
-            start1, end1 = edge1.Vertexes[0].Point, edge1.Vertexes[1].Point
-            start2, end2 = edge2.Vertexes[0].Point, edge2.Vertexes[1].Point
-
-            # Project all points onto the common line direction
-            proj_start1 = dir1.dot(start1 - line_origin1)
-            proj_end1 = dir1.dot(end1 - line_origin1)
-            proj_start2 = dir1.dot(start2 - line_origin1)
-            proj_end2 = dir1.dot(end2 - line_origin1)
-
-            # Ensure proper ordering (start < end) for intervals
-            if proj_end1 < proj_start1:
-                proj_start1, proj_end1 = proj_end1, proj_start1
-            if proj_end2 < proj_start2:
-                proj_start2, proj_end2 = proj_end2, proj_start2
-
-            # Check for overlap in the projected 1D intervals
-            overlap_start = max(proj_start1, proj_start2)
-            overlap_end = min(proj_end1, proj_end2)
-            
-            return (overlap_end - overlap_start) > GeometryMatcher.TOLERANCE
-
+            curve = edge.Curve
+            type_code = _type_code(curve.TypeId)
+            vertexes = edge.Vertexes
+            ends = (_xyz(vertexes[0].Point), _xyz(vertexes[1].Point)) if len(vertexes) >= 2 else None
+            circle = line = None
+            if type_code == _CIRCLE:
+                circle = (_xyz(curve.Center), curve.Radius, _xyz(curve.Axis),
+                          curve.FirstParameter, curve.LastParameter)
+            elif type_code == _LINE:
+                line = (_xyz(curve.Direction), _xyz(curve.Location))
+            return (type_code, edge.Length, ends, circle, line)
         except Exception:
-            return False
+            return None
 
-    @staticmethod
-    def _check_circle_similarity(edge1: Part.Edge, edge2: Part.Edge) -> bool:
-        """Check similarity for circular edges (same plane, radius, and center point with angular overlap)."""
-        try:
-            # Check if centers are the same
-            center1 = edge1.Curve.Center
-            center2 = edge2.Curve.Center
-            if center1.distanceToPoint(center2) > GeometryMatcher.TOLERANCE:
-                return False
-
-            # Check if radii are effectively the same
-            radius1 = edge1.Curve.Radius
-            radius2 = edge2.Curve.Radius
-            if abs(radius1 - radius2) > GeometryMatcher.TOLERANCE:
-                return False
-
-            # Check if their planes are parallel (normals are aligned)
-            if hasattr(edge1.Curve, 'Axis') and hasattr(edge2.Curve, 'Axis'):
-                axis1 = edge1.Curve.Axis
-                axis2 = edge2.Curve.Axis
-                if abs(axis1.dot(axis2)) < (1 - GeometryMatcher.TOLERANCE):
-                    return False
+    @classmethod
+    def build(cls, feature: Any) -> 'FeatureEdgeCache':
+        """Extract the edge arrays of a feature."""
+        edges = FeatureAnalyzer.extract_edges(feature)
+        records = [cls.edge_record(edge) for edge in edges]
+
+        n = len(records)
+        geom = cls(
+            edges=edges,
+            valid=np.zeros(n, dtype=bool),
+            typeids=np.full(n, -1, dtype=np.int64),
+            lengths=np.zeros(n),
+            has_ends=np.zeros(n, dtype=bool),
+            starts=np.zeros((n, 3)),
+            ends=np.zeros((n, 3)),
+            centers=np.zeros((n, 3)),
+            radii=np.zeros(n),
+            has_axis=np.zeros(n, dtype=bool),
+            axes=np.zeros((n, 3)),
+            first=np.zeros(n),
+            last=np.zeros(n),
+            directions=np.zeros((n, 3)),
+            locations=np.zeros((n, 3)),
+        )
+        for i, record in enumerate(records):
+            if record is None:
+                continue
+            type_code, length, ends, circle, line = record
+            geom.valid[i] = True
+            geom.typeids[i] = type_code
+            geom.lengths[i] = length
+            if ends is not None:
+                geom.has_ends[i] = True
+                geom.starts[i], geom.ends[i] = ends
+            if circle is not None:
+                center, radius, axis, first, last = circle
+                geom.centers[i] = center
+                geom.radii[i] = radius
+                if axis is not None:
+                    geom.has_axis[i] = True
+                    geom.axes[i] = axis
+                geom.first[i] = first
+                geom.last[i] = last
+            if line is not None:
+                geom.directions[i], geom.locations[i] = line
+        return geom
+
+    def match_edges(self, current: Optional[tuple]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the indices of exact and similar matches for an edge record.
+        Exact: same curve type with matching endpoints in either direction,
+        plus same length for non-circles, or same center, radius, axis and
+        angular span for circles. Similar: collinear overlapping lines, or
+        concentric arcs in parallel planes that overlap (or are both full
+        circles). Edges matching exactly are not reported as similar.
+        """
+        empty = np.zeros(0, dtype=np.intp)
+        if current is None or not self.edges:
+            return empty, empty
+
+        # Every criterion needs the same curve type, so only those edges
+        # have their geometry compared
+        tol = GeometryMatcher.TOLERANCE
+        tol_sq = GeometryMatcher.TOLERANCE_SQ
+        type_code, length, ends, circle, line = current
+        candidates = np.flatnonzero(self.valid & (self.typeids == type_code))
+        if not candidates.size:
+            return empty, empty
+        n = candidates.size
+        has_ends = self.has_ends[candidates]
+        starts = self.starts[candidates]
+        others_end = self.ends[candidates]
+        no_match = np.zeros(n, dtype=bool)
+
+        # Both exact tests end with the endpoints matching in either direction
+        if ends is None:
+            endpoints = no_match
+        else:
+            start, end = np.asarray(ends[0]), np.asarray(ends[1])
+            forward = ((_sq_norms(starts - start) < tol_sq)
+                       & (_sq_norms(others_end - end) < tol_sq))
+            reverse = ((_sq_norms(others_end - start) < tol_sq)
+                       & (_sq_norms(starts - end) < tol_sq))
+            endpoints = has_ends & (forward | reverse)
+
+        if circle is not None:
+            center, radius, axis, first, last = circle
+            others_first = self.first[candidates]
+            others_last = self.last[candidates]
+            concentric = ((_sq_norms(self.centers[candidates] - np.asarray(center)) <= tol_sq)
+                          & (np.abs(self.radii[candidates] - radius) <= tol))
+            if axis is None:
+                parallel = no_match
+                exact_axis = concentric
             else:
-                return False
-
-            # If they are full circles with same center, radius, and plane, they are similar
-            is_full_circle1 = abs(edge1.Curve.LastParameter - edge1.Curve.FirstParameter - 2 * math.pi) < GeometryMatcher.TOLERANCE
-            is_full_circle2 = abs(edge2.Curve.LastParameter - edge2.Curve.FirstParameter - 2 * math.pi) < GeometryMatcher.TOLERANCE
-
-            if is_full_circle1 and is_full_circle2:
-                return True
-
-            # If both are arcs, check for angular overlap
-            if hasattr(edge1.Curve, 'FirstParameter') and hasattr(edge2.Curve, 'FirstParameter'):
-                angle1_start = edge1.Curve.FirstParameter
-                angle1_end = edge1.Curve.LastParameter
-                angle2_start = edge2.Curve.FirstParameter
-                angle2_end = edge2.Curve.LastParameter
-
-                # Normalize angles to handle wraparound (e.g., arc from 300 to 30 degrees).
-                while angle1_end < angle1_start:
-                    angle1_end += 2 * math.pi
-                while angle2_end < angle2_start:
-                    angle2_end += 2 * math.pi
+                has_axis = self.has_axis[candidates]
+                parallel = has_axis & (np.abs(self.axes[candidates] @ np.asarray(axis)) >= 1 - tol)
+                exact_axis = concentric & (~has_axis | parallel)
+
+            # Exact: same angular span and endpoints
+            last_n = float(_unwrap_end(first, last))
+            other_last = _unwrap_end(others_first, others_last)
+            span = abs(last_n - first)
+            spans = np.abs(other_last - others_first)
+            exact = exact_axis & (np.abs(spans - span) <= tol) & endpoints
+
+            # Similar: same plane, full circles or overlapping arcs
+            full = abs(last - first - 2 * math.pi) < tol
+            others_full = np.abs(others_last - others_first - 2 * math.pi) < tol
+            overlap = (np.minimum(other_last, last_n) - np.maximum(others_first, first)) > tol
+            similar = (concentric & parallel) & ((others_full & full) | overlap)
+        else:
+            exact = (np.abs(self.lengths[candidates] - length) <= tol) & endpoints
+
+            if line is not None and ends is not None:
+                # The selected edge's own interval is a handful of scalars, so it
+                # is worked out on tuples; NumPy is kept for the candidate rows
+                (dx, dy, dz), (ox, oy, oz) = line
+                (sx, sy, sz), (ex, ey, ez) = ends
+                p1 = sorted((dx * (sx - ox) + dy * (sy - oy) + dz * (sz - oz),
+                             dx * (ex - ox) + dy * (ey - oy) + dz * (ez - oz)))
+
+                direction, location = np.asarray(line[0]), np.asarray(line[1])
+                collinear = ((np.abs(self.directions[candidates] @ direction) >= 1 - tol)
+                             & (_sq_norms(np.cross(self.locations[candidates] - location, direction)) <= tol_sq))
+                # Overlap of the projections onto the selected line
+                p_starts = (starts - location) @ direction
+                p_ends = (others_end - location) @ direction
+                low = np.minimum(p_starts, p_ends)
+                high = np.maximum(p_starts, p_ends)
+                overlap = (np.minimum(high, p1[1]) - np.maximum(low, p1[0])) > tol
+                similar = collinear & has_ends & overlap
+            else:
+                similar = no_match
 
-                overlap_start = max(angle1_start, angle2_start)
-                overlap_end = min(angle1_end, angle2_end)
+        similar = similar & ~exact
+        return candidates[exact], candidates[similar]
 
-                return (overlap_end - overlap_start) > GeometryMatcher.TOLERANCE
 
-            return False
+@dataclass
+class FeatureVertexCache:
+    """
+    Vertex positions of one feature, bucketed on a grid of TOLERANCE-sized cells.
+    A point within tolerance of another lies in the same or a neighbouring
+    cell, so a match is found by looking at 27 cells instead of every vertex.
+    """
 
-        except Exception:
-            return False
+    vertices: List[Part.Vertex]
+    points: np.ndarray  # float[N, 3]
+    buckets: Dict[Tuple[int, int, int], List[int]]
 
     @staticmethod
-    def vertices_exact_match(vertex1: Part.Vertex, vertex2: Part.Vertex) -> bool:
-        """Check if two vertices are exact matches."""
+    def vertex_point(vertex: Part.Vertex) -> Optional[Tuple[float, float, float]]:
+        """Return the vertex position as a tuple, or None if it could not be read."""
         try:
-            return vertex1.Point.distanceToPoint(vertex2.Point) < GeometryMatcher.TOLERANCE
+            return _xyz(vertex.Point)
         except Exception:
-            return False
-
-class FeatureAnalyzer:
-    """Analyzes features in a body to extract geometric elements."""
-
-    @staticmethod
-    def get_body_features(body: Any) -> List[Any]:
-        """Get all features in a body ordered by creation sequence."""
-        features = []
-        if hasattr(body, 'Group'):
-            for obj in body.Group:
-                if hasattr(obj, 'Shape') and obj.Shape:
-                    features.append(obj)
-        return features
-
-    @staticmethod
-    def extract_faces(feature: Any) -> List[Tuple[Part.Face, str]]:
-        """Extract all faces from a feature with their names."""
-        faces = []
-        if hasattr(feature, 'Shape') and feature.Shape:
-            for i, face in enumerate(feature.Shape.Faces):
-                face_name = f"Face{i+1}"
-                faces.append((face, face_name))
-        return faces
-
-    @staticmethod
-    def extract_edges(feature: Any) -> List[Tuple[Part.Edge, str]]:
-        """Extract all edges from a feature with their names."""
-        edges = []
-        if hasattr(feature, 'Shape') and feature.Shape:
-            for i, edge in enumerate(feature.Shape.Edges):
-                edge_name = f"Edge{i+1}"
-                edges.append((edge, edge_name))
-        return edges
+            return None
 
-    @staticmethod
-    def extract_vertices(feature: Any) -> List[Tuple[Part.Vertex, str]]:
-        """Extract all vertices from a feature with their names."""
+    @classmethod
+    def build(cls, feature: Any) -> 'FeatureVertexCache':
+        """Extract and bucket the vertex positions of a feature."""
         vertices = []
-        if hasattr(feature, 'Shape') and feature.Shape:
-            for i, vertex in enumerate(feature.Shape.Vertexes):
-                vertex_name = f"Vertex{i+1}"
-                vertices.append((vertex, vertex_name))
-        return vertices
+        points = []
+        readable = []
+        for vertex in FeatureAnalyzer.extract_vertices(feature):
+            point = cls.vertex_point(vertex)
+            vertices.append(vertex)
+            points.append(point if point is not None else (0.0, 0.0, 0.0))
+            readable.append(point is not None)
+
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        buckets: Dict[Tuple[int, int, int], List[int]] = {}
+        cells = np.floor(points / GeometryMatcher.TOLERANCE).astype(np.int64).tolist()
+        for i, cell in enumerate(cells):
+            if readable[i]:
+                buckets.setdefault(tuple(cell), []).append(i)
+        return cls(vertices=vertices, points=points, buckets=buckets)
+
+    def match_vertices(self, point: Optional[Tuple[float, float, float]]) -> List[int]:
+        """Return the indices of vertices within tolerance of a point, in vertex order."""
+        if point is None:
+            return []
+
+        tol = GeometryMatcher.TOLERANCE
+        cx, cy, cz = (math.floor(c / tol) for c in point)
+        candidates = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for dz in (-1, 0, 1):
+                    candidates.extend(self.buckets.get((cx + dx, cy + dy, cz + dz), ()))
+        if not candidates:
+            return []
+
+        candidates.sort()
+        sq_distances = _sq_norms(self.points[candidates] - np.asarray(point))
+        return [i for i, d in zip(candidates, sq_distances) if d < GeometryMatcher.TOLERANCE_SQ]
 
 
 class SelectionTracker(QtCore.QObject):
@@ -339,10 +478,16 @@ class SelectionTracker(QtCore.QObject):
 
     selection_changed = QtCore.Signal(object)
 
+    # Bursts of selection events (marquee, multi-select) are coalesced into one
+    DEBOUNCE_MS = 50
+
     def __init__(self):
         super().__init__()
         self.current_selection = None
         self.selection_observer = None
+        self._debounce_timer = QtCore.QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._emit_selection)
 
     def start_tracking(self):
         """Start tracking selection changes."""
@@ -354,11 +499,16 @@ class SelectionTracker(QtCore.QObject):
         if self.selection_observer:
             Gui.Selection.removeObserver(self.selection_observer)
             self.selection_observer = None
+        self._debounce_timer.stop()
 
     def update_selection(self, selection_info):
-        """Update current selection and emit signal."""
+        """Update current selection and emit signal once the events settle."""
         self.current_selection = selection_info
-        self.selection_changed.emit(selection_info)
+        self._debounce_timer.start(self.DEBOUNCE_MS)
+
+    def _emit_selection(self):
+        """Emit the latest selection."""
+        self.selection_changed.emit(self.current_selection)
 
 
 class SelectionObserver:
@@ -421,6 +571,24 @@ class SelectionObserver:
             self.tracker.update_selection(None)
 
 
+class DocumentChangeObserver:
+    """Document observer that counts changes which can alter a body's feature list."""
+
+    def __init__(self):
+        self.generation = 0
+
+    def _changed(self, *args):
+        self.generation += 1
+
+    slotCreatedObject = slotDeletedObject = slotRecomputedDocument = _changed
+    slotDeletedDocument = slotUndoDocument = slotRedoDocument = _changed
+
+    def slotChangedObject(self, obj, prop):
+        """Called for every property change; only body membership and shapes matter."""
+        if prop in ('Group', 'Shape'):
+            self.generation += 1
+
+
 class TopoMatchSelectorWidget(QtGui.QWidget):
     """Main widget for the TopoMatchSelector docker."""
 
@@ -429,6 +597,14 @@ class TopoMatchSelectorWidget(QtGui.QWidget):
         self.selection_tracker = SelectionTracker()
         self.current_body = None
         self.current_selection = None
+        # (document name, feature name, cache class) -> (Shape.hashCode(), cache)
+        self._geom_cache: Dict[Tuple[str, str, type], Tuple[int, Any]] = {}
+        # (document name, object name) -> body whose Group holds the object
+        self._obj_to_body: Dict[Tuple[str, str], Any] = {}
+        # (body key, body features, feature name -> index), see get_feature_order()
+        self._feature_order: Optional[Tuple[tuple, List[Any], Dict[str, int]]] = None
+        self.document_observer = DocumentChangeObserver()
+        App.addDocumentObserver(self.document_observer)
         self.setup_ui()
         self.connect_signals()
         self.selection_tracker.start_tracking()
@@ -536,12 +712,25 @@ class TopoMatchSelectorWidget(QtGui.QWidget):
     def find_parent_body(self, obj):
         """Find the parent body of an object."""
         try:
-            # Check if object is directly in a body
-            for body in App.ActiveDocument.Objects:
-                if hasattr(body, 'TypeId') and body.TypeId == 'PartDesign::Body':
-                    if hasattr(body, 'Group') and obj in body.Group:
+            doc = App.ActiveDocument
+            key = (doc.Name, obj.Name)
+            body = self._obj_to_body.get(key)
+            if body is not None:
+                # Features can move between bodies, so confirm the cached answer
+                try:
+                    if obj in body.Group:
                         return body
-            return None
+                except Exception:
+                    pass  # Body was deleted
+
+            # Map every body member in one walk over the document
+            self._obj_to_body = {}
+            for body in doc.Objects:
+                if hasattr(body, 'TypeId') and body.TypeId == 'PartDesign::Body':
+                    if hasattr(body, 'Group'):
+                        for member in body.Group:
+                            self._obj_to_body.setdefault((doc.Name, member.Name), body)
+            return self._obj_to_body.get(key)
         except Exception:
             return None
 
@@ -552,18 +741,25 @@ class TopoMatchSelectorWidget(QtGui.QWidget):
 
         try:
             # Get all features in the body
-            features = FeatureAnalyzer.get_body_features(self.current_body)
+            features, feature_index = self.get_feature_order(self.current_body)
             current_obj = self.current_selection['object']
 
             # Find features that come before the current one
-            try:
-                current_index = features.index(current_obj)
+            current_index = feature_index.get(current_obj.Name)
+            if current_index is not None:
                 earlier_features = features[:current_index]
-            except ValueError:
+            else:
                 earlier_features = features
 
             selection_type = self.current_selection['type']
             current_shape = self.current_selection['shape']
+            # Read the selected geometry once for all features
+            if selection_type == 'Face':
+                current_shape = FeatureGeomCache.face_record(current_shape)
+            elif selection_type == 'Edge':
+                current_shape = FeatureEdgeCache.edge_record(current_shape)
+            elif selection_type == 'Vertex':
+                current_shape = FeatureVertexCache.vertex_point(current_shape)
 
             exact_matches = []
             similar_matches = []
@@ -594,68 +790,87 @@ class TopoMatchSelectorWidget(QtGui.QWidget):
         except Exception as e:
             self.status_browser.setText(f"Error finding matches: {str(e)}")
 
-    def find_face_matches(self, feature, current_face):
-        """Find face matches in a feature."""
-        exact_matches = []
-        similar_matches = []
+    def get_feature_order(self, body):
+        """Return the body's features and a name -> position map, reused until a document change."""
+        # The observer counts Group/Shape changes, recomputes, undo/redo and
+        # created or deleted objects, so the key costs no walk over body.Group
+        key = (body.Document.Name, body.Name, self.document_observer.generation)
+        if self._feature_order is None or self._feature_order[0] != key:
+            features = FeatureAnalyzer.get_body_features(body)
+            index = {feature.Name: i for i, feature in enumerate(features)}
+            self._feature_order = (key, features, index)
+
+            # Drop the arrays of features that were deleted, renamed or belong
+            # to another body or document, so they are not kept alive forever
+            doc_name = body.Document.Name
+            self._geom_cache = {
+                cache_key: cached for cache_key, cached in self._geom_cache.items()
+                if cache_key[0] == doc_name and cache_key[1] in index
+            }
+        return self._feature_order[1], self._feature_order[2]
+
+    def get_feature_geom(self, feature, cache_cls=None):
+        """Return the cached geometry arrays of a feature, rebuilt after its shape changes."""
+        cache_cls = cache_cls or FeatureGeomCache
+        key = (feature.Document.Name, feature.Name, cache_cls)
+        shape_hash = feature.Shape.hashCode()
+        cached = self._geom_cache.get(key)
+        if cached is None or cached[0] != shape_hash:
+            # A recompute gives the feature a new shape and therefore a new hash
+            cached = self._geom_cache[key] = (shape_hash, cache_cls.build(feature))
+        return cached[1]
 
-        faces = FeatureAnalyzer.extract_faces(feature)
-        for face, face_name in faces:
-            if GeometryMatcher.faces_exact_match(current_face, face):
-                exact_matches.append({
-                    'feature': feature,
-                    'name': face_name,
-                    'shape': face
-                })
-            elif GeometryMatcher.faces_similar_match(current_face, face):
-                similar_matches.append({
-                    'feature': feature,
-                    'name': face_name,
-                    'shape': face
-                })
+    def find_face_matches(self, feature, current_face):
+        """Find face matches in a feature (`current_face` is a FeatureGeomCache.face_record)."""
+        geom = self.get_feature_geom(feature)
+        exact_idx, similar_idx = geom.match_faces(current_face)
+
+        exact_matches = [{
+            'feature': feature,
+            'name': f"Face{i + 1}",
+            'shape': geom.faces[i]
+        } for i in exact_idx]
+        similar_matches = [{
+            'feature': feature,
+            'name': f"Face{i + 1}",
+            'shape': geom.faces[i]
+        } for i in similar_idx]
 
         return {'exact': exact_matches, 'similar': similar_matches}
 
     def find_edge_matches(self, feature, current_edge):
-        """Find edge matches in a feature."""
-        exact_matches = []
-        similar_matches = []
-
-        edges = FeatureAnalyzer.extract_edges(feature)
-        for edge, edge_name in edges:
-            if GeometryMatcher.edges_exact_match(current_edge, edge):
-                exact_matches.append({
-                    'feature': feature,
-                    'name': edge_name,
-                    'shape': edge
-                })
-            elif GeometryMatcher.edges_similar_match(current_edge, edge):
-                similar_matches.append({
-                    'feature': feature,
-                    'name': edge_name,
-                    'shape': edge
-                })
+        """Find edge matches in a feature (`current_edge` is a FeatureEdgeCache.edge_record)."""
+        geom = self.get_feature_geom(feature, FeatureEdgeCache)
+        exact_idx, similar_idx = geom.match_edges(current_edge)
+
+        exact_matches = [{
+            'feature': feature,
+            'name': f"Edge{i + 1}",
+            'shape': geom.edges[i]
+        } for i in exact_idx]
+        similar_matches = [{
+            'feature': feature,
+            'name': f"Edge{i + 1}",
+            'shape': geom.edges[i]
+        } for i in similar_idx]
 
         return {'exact': exact_matches, 'similar': similar_matches}
 
     def find_vertex_matches(self, feature, current_vertex):
-        """Find vertex matches in a feature."""
-        exact_matches = []
-        similar_matches = []
-
-        vertices = FeatureAnalyzer.extract_vertices(feature)
-        for vertex, vertex_name in vertices:
-            if GeometryMatcher.vertices_exact_match(current_vertex, vertex):
-                exact_matches.append({
-                    'feature': feature,
-                    'name': vertex_name,
-                    'shape': vertex
-                })
+        """Find vertex matches in a feature (`current_vertex` is a FeatureVertexCache.vertex_point)."""
+        geom = self.get_feature_geom(feature, FeatureVertexCache)
 
-        return {'exact': exact_matches, 'similar': similar_matches}
+        exact_matches = [{
+            'feature': feature,
+            'name': f"Vertex{i + 1}",
+            'shape': geom.vertices[i]
+        } for i in geom.match_vertices(current_vertex)]
+
+        return {'exact': exact_matches, 'similar': []}
 
     def populate_match_list(self, list_widget, matches):
         """Populate a list widget with matches."""
+        items = []
         for match in matches:
             feature_label = match['feature'].Label
             item_name = match['name']
@@ -666,11 +881,26 @@ class TopoMatchSelectorWidget(QtGui.QWidget):
                 'object': match['feature'].Name,
                 'sub_name': item_name
             })
-            list_widget.addItem(item)
+            items.append(item)
+
+        # Add everything with repaints and signals held back, so large match
+        # sets cause one relayout instead of one per item
+        list_widget.setUpdatesEnabled(False)
+        list_widget.blockSignals(True)
+        try:
+            for item in items:
+                list_widget.addItem(item)
+        finally:
+            list_widget.blockSignals(False)
+            list_widget.setUpdatesEnabled(True)
+            list_widget.update()
 
     def closeEvent(self, event):
         """Handle widget close event."""
         self.selection_tracker.stop_tracking()
+        if self.document_observer:
+            App.removeDocumentObserver(self.document_observer)
+            self.document_observer = None
         event.accept()
 
 
@@ -461,10 +461,14 @@ class UpdateVarSetDialog(QtGui.QDialog):
                 self.results_text.append(f"Failed to show error dialog: {inner_e}")
 
 
-# Run the dialog
-app = QtGui.QApplication.instance()
-if not app:
-    app = QtGui.QApplication([])
+def show_update_varset_dialog():
+    app = QtGui.QApplication.instance()
+    if not app:
+        app = QtGui.QApplication([])
+
+    dialog = UpdateVarSetDialog()
+    dialog.exec()
 
-dialog = UpdateVarSetDialog()
-dialog.exec()
+# Run the dialog
+if __name__ == "__main__":
+    show_update_varset_dialog()